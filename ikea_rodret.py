@@ -2,6 +2,8 @@
 
 import asyncio
 import logging
+from itertools import product
+from types import MappingProxyType
 
 from zigpy.profiles import zha
 from zigpy.quirks import CustomDevice
@@ -23,170 +25,201 @@ _LOGGER = logging.getLogger(__name__)
 CLICK_TIMEOUT = 0.45  # 450ms window for detecting multiple clicks
 DUAL_BUTTON_TIMEOUT = 0.15  # 150ms window for detecting simultaneous button presses
 
-# Click type mapping
-CLICK_TYPES = {
-    1: SHORT_PRESS,
-    2: DOUBLE_PRESS,
-    3: TRIPLE_PRESS,
-    4: QUADRUPLE_PRESS,
-    5: QUINTUPLE_PRESS,
-}
+# Click type mapping, indexed by click count (counts above 5 are capped)
+CLICK_TYPES = (None, SHORT_PRESS, DOUBLE_PRESS, TRIPLE_PRESS, QUADRUPLE_PRESS, QUINTUPLE_PRESS)
+MAX_CLICKS = len(CLICK_TYPES) - 1
 
 # Button names
 ON_BUTTON = "on"
 OFF_BUTTON = "off"
 DUAL_BUTTON = "dual"
 
+# Button codes recorded per press (one bit each), and button names indexed by code
+ON_CODE = 0
+OFF_CODE = 1
+DUAL_CODE = 2
+BUTTON_NAMES = (ON_BUTTON, OFF_BUTTON, DUAL_BUTTON)
+
+# Event names per button code, indexed by click count
+EVENT_NAMES = {
+    ON_CODE: (None,) + tuple(f"{ON_BUTTON}_{click_type}" for click_type in CLICK_TYPES[1:]),
+    OFF_CODE: (None,) + tuple(f"{OFF_BUTTON}_{click_type}" for click_type in CLICK_TYPES[1:]),
+    DUAL_CODE: (None, COMMAND_BUTTON_DOUBLE) + tuple(
+        f"{COMMAND_BUTTON_DOUBLE}_{click_type}" for click_type in CLICK_TYPES[2:]
+    ),
+}
+
+
+def _dual_pair_bits(count: int) -> int:
+    """Return the bits of the presses closing the second and later dual pairs.
+
+    For an even press count of 4 or more these are presses 3, 5, ...: a
+    repeated dual press needs each of them to differ from, and follow quickly
+    on, the press before it.
+    """
+    return sum(1 << i for i in range(3, count, 2))
+
+
+# Dual pair bits for every repeated dual press that has a trigger (up to
+# quintuple, i.e. 10 presses); longer bursts compute theirs on demand
+DUAL_PAIR_BITS = {count: _dual_pair_bits(count) for count in range(4, 2 * MAX_CLICKS + 1, 2)}
+
+
+def _sequence_mask(sequence) -> int:
+    """Pack button codes into a bitmask, first press in the lowest bit."""
+    return sum(button << i for i, button in enumerate(sequence))
+
+
+# Event names for mixed-button sequences of 2 and 3 presses, keyed by
+# (press count, button mask)
+SEQUENCE_EVENT_NAMES = {
+    (length, _sequence_mask(sequence)): "_".join(BUTTON_NAMES[button] for button in sequence)
+    for length in (2, 3)
+    for sequence in product((ON_CODE, OFF_CODE), repeat=length)
+    if len(set(sequence)) > 1
+}
+
+# Shared (empty) arguments for emitted events; ZHA expects a list or dict, so
+# this stays a plain dict and must not be mutated
+EMPTY_EVENT_ARGS = {}
+
 
 class MultiClickOnOffCluster(OnOff):
     """OnOff cluster with multi-click detection for single and dual button presses."""
 
+    # Button code pressed for each intercepted command id
+    _COMMAND_BUTTONS = {
+        0x00: OFF_CODE,  # OFF command
+        0x01: ON_CODE,  # ON command
+    }
+
+    # Configurable timeouts (can be overridden per instance, e.g. for testing)
+    click_timeout = CLICK_TIMEOUT
+    dual_button_timeout = DUAL_BUTTON_TIMEOUT
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        # Track button presses with timestamps: [(button, timestamp), ...]
-        try:
-            object.__setattr__(self, '_presses', [])
-            object.__setattr__(self, '_timer', None)
-            # Configurable timeouts (can be overridden for testing)
-            object.__setattr__(self, 'click_timeout', CLICK_TIMEOUT)
-            object.__setattr__(self, 'dual_button_timeout', DUAL_BUTTON_TIMEOUT)
-        except Exception:
-            pass
-
-    def __getattr__(self, name):
-        """Handle attribute access for private attributes."""
-        if name in ('_presses', '_timer', 'click_timeout', 'dual_button_timeout'):
-            try:
-                return object.__getattribute__(self, name)
-            except AttributeError:
-                if name == '_presses':
-                    presses = []
-                    object.__setattr__(self, '_presses', presses)
-                    return presses
-                elif name == '_timer':
-                    return None
-                elif name == 'click_timeout':
-                    return CLICK_TIMEOUT
-                elif name == 'dual_button_timeout':
-                    return DUAL_BUTTON_TIMEOUT
-        return super().__getattr__(name)
-
-    async def _handle_click(self, button: str) -> None:
+        self._init_click_state()
+
+    def _init_click_state(self) -> None:
+        """Initialize multi-click tracking state."""
+        # Track button presses as bitmasks (bit i describes press i): the button
+        # code of each press, and whether it arrived within dual_button_timeout
+        # of the previous one. The masks grow with the burst, so every press
+        # counts towards the classification
+        self._press_mask = 0
+        self._quick_mask = 0
+        self._press_count = 0
+        self._last_press_time = 0.0
+        self._timer = None
+        # Event loop, resolved on first press
+        self._loop = None
+        # Multi-click detection only applies to real devices, not groups
+        self._is_device_cluster = self._check_is_device_cluster()
+
+    def _check_is_device_cluster(self) -> bool:
+        """Return True if this cluster belongs to a device rather than a group."""
+        return hasattr(self.endpoint, 'device') and hasattr(self.endpoint.device, 'ieee')
+
+    def _now(self) -> float:
+        """Return the event loop time, caching the running loop on first use."""
+        loop = self._loop
+        if loop is None:
+            loop = self._loop = asyncio.get_running_loop()
+        return loop.time()
+
+    def _handle_click(self, button: int) -> None:
         """Handle button click with multi-click and sequence detection."""
-        now = asyncio.get_event_loop().time()
-        
-        # Ensure _presses exists
-        try:
-            presses = object.__getattribute__(self, '_presses')
-        except AttributeError:
-            presses = []
-            object.__setattr__(self, '_presses', presses)
+        now = self._now()
+        count = self._press_count
         
-        # Add this press
-        presses.append((button, now))
+        # Add this press, noting whether it falls in the dual button window
+        self._press_mask |= button << count
+        if count and now - self._last_press_time < self.dual_button_timeout:
+            self._quick_mask |= 1 << count
+        self._press_count = count + 1
+        self._last_press_time = now
         
         # Cancel existing timer
-        try:
-            timer = object.__getattribute__(self, '_timer')
-        except AttributeError:
-            timer = None
-        
+        timer = self._timer
         if timer:
             timer.cancel()
         
-        # Set new timer to process presses
-        object.__setattr__(self, '_timer', asyncio.create_task(self._process_presses()))
+        # Set new timer to process presses (one shared timer for all buttons)
+        self._timer = self._loop.call_later(self.click_timeout, self._fire_clicks)
 
-    async def _process_presses(self) -> None:
+    def _fire_clicks(self) -> None:
         """Process accumulated presses after timeout."""
-        try:
-            await asyncio.sleep(self.click_timeout)
-            self._emit_event_for_presses()
-            self._presses.clear()
-        except asyncio.CancelledError:
-            pass
+        self._timer = None
+        self._emit_event_for_presses()
+        self._press_mask = self._quick_mask = self._press_count = 0
 
     def _emit_event_for_presses(self) -> None:
         """Analyze presses and emit appropriate event."""
-        presses = self._presses
-        if not presses:
+        mask = self._press_mask
+        quick = self._quick_mask
+        count = self._press_count
+        if not count:
             return
         
-        # Extract buttons and timestamps
-        buttons = [p[0] for p in presses]
-        times = [p[1] for p in presses]
-        
         event_name = None
         
         # Determine event type based on press pattern
-        if len(presses) == 1:
-            # Single press
-            event_name = f"{buttons[0]}_{SHORT_PRESS}"
+        if count == 1:
+            # Single press (the common case)
+            event_name = EVENT_NAMES[mask][1]
         
-        elif len(set(buttons)) == 1:
-            # All same button - count presses
-            count = len(presses)
-            if count > 5:
-                count = 5
-            
-            click_type = CLICK_TYPES.get(count, SHORT_PRESS)
-            event_name = f"{buttons[0]}_{click_type}"
+        elif mask == 0 or mask.bit_count() == count:
+            # All same button (no OFF bits, or only OFF bits) - count presses
+            event_name = EVENT_NAMES[mask & 1][min(count, MAX_CLICKS)]
         
         else:
             # Mixed buttons - check timing to distinguish dual vs sequential
-            time_between_first_two = times[1] - times[0]
-            
-            if time_between_first_two < self.dual_button_timeout and len(presses) == 2:
+            if quick & 0b10 and count == 2:
                 # Very fast (dual button timeout) AND exactly 2 presses - treat as dual button press
-                event_name = "button_double"
+                event_name = EVENT_NAMES[DUAL_CODE][1]
             
-            elif time_between_first_two < self.dual_button_timeout and len(presses) > 2:
+            elif quick & 0b10 and count > 2:
                 # Very fast but more than 2 presses - check for repeated dual button pattern
                 # Only treat as dual button if it's a clear pattern like ON-OFF-ON-OFF
-                dual_count = 1
-                i = 2
-                while i + 1 < len(presses):
-                    if (buttons[i] != buttons[i+1] and 
-                        (times[i+1] - times[i]) < self.dual_button_timeout and
-                        (times[i] - times[i-1]) < self.click_timeout):
-                        dual_count += 1
-                        i += 2
-                    else:
-                        break
-                
-                if dual_count > 1 and i == len(presses):
+                # (gaps between pairs are always below click_timeout, as every
+                # press restarts the click timer)
+                pair_bits = DUAL_PAIR_BITS.get(count)
+                if pair_bits is None and not count & 1:
+                    pair_bits = _dual_pair_bits(count)
+                if pair_bits and ((mask ^ (mask << 1)) & quick & pair_bits) == pair_bits:
                     # Complete dual button pattern (all presses accounted for)
-                    click_type = CLICK_TYPES.get(dual_count, QUINTUPLE_PRESS)
-                    event_name = f"button_double_{click_type}"
+                    event_name = EVENT_NAMES[DUAL_CODE][min(count // 2, MAX_CLICKS)]
                 else:
                     # Incomplete pattern or mixed - treat as sequential
-                    event_name = "_".join(buttons)
+                    event_name = self._sequence_event_name(mask, count)
             
             else:
                 # Slower (sequential timeout) - treat as sequential button press
-                event_name = "_".join(buttons)
+                event_name = self._sequence_event_name(mask, count)
         
         # Emit the event
         if event_name:
-            _LOGGER.debug(f"RODRET: Emitting event: {event_name}")
-            self.listener_event(ZHA_SEND_EVENT, event_name, {})
+            _LOGGER.debug("RODRET: Emitting event: %s", event_name)
+            self.listener_event(ZHA_SEND_EVENT, event_name, EMPTY_EVENT_ARGS)
+
+    @staticmethod
+    def _sequence_event_name(mask: int, count: int) -> str:
+        """Return the event name for a sequence of mixed button presses."""
+        return SEQUENCE_EVENT_NAMES.get((count, mask)) or "_".join(
+            BUTTON_NAMES[(mask >> i) & 1] for i in range(count)
+        )
 
     def handle_cluster_request(self, hdr, args, **kwargs):
         """Handle cluster requests - intercept button presses."""
-        # Only do multi-click detection for actual devices, not groups
-        if not (hasattr(self.endpoint, 'device') and hasattr(self.endpoint.device, 'ieee')):
+        # Pass through other commands, and everything sent by groups: multi-click
+        # detection only applies to on/off commands from actual devices
+        button = self._COMMAND_BUTTONS.get(hdr.command_id)
+        if button is None or not self._is_device_cluster:
             return super().handle_cluster_request(hdr, args, **kwargs)
 
-        # Check for on/off commands
-        if hdr.command_id == 0x01:  # ON command
-            asyncio.create_task(self._handle_click(ON_BUTTON))
-            return None
-        elif hdr.command_id == 0x00:  # OFF command
-            asyncio.create_task(self._handle_click(OFF_BUTTON))
-            return None
-        
-        # Pass through other commands
-        return super().handle_cluster_request(hdr, args, **kwargs)
+        self._handle_click(button)
+        return None
 
 
 class IkeaRodretRemoteMultiClick(CustomDevice):
@@ -244,27 +277,25 @@ class IkeaRodretRemoteMultiClick(CustomDevice):
         }
     }
 
-    device_automation_triggers = {
-        (SHORT_PRESS, COMMAND_ON): {COMMAND: f"{COMMAND_ON}_{SHORT_PRESS}"},
-        (DOUBLE_PRESS, COMMAND_ON): {COMMAND: f"{COMMAND_ON}_{DOUBLE_PRESS}"},
-        (TRIPLE_PRESS, COMMAND_ON): {COMMAND: f"{COMMAND_ON}_{TRIPLE_PRESS}"},
-        (QUADRUPLE_PRESS, COMMAND_ON): {COMMAND: f"{COMMAND_ON}_{QUADRUPLE_PRESS}"},
-        (QUINTUPLE_PRESS, COMMAND_ON): {COMMAND: f"{COMMAND_ON}_{QUINTUPLE_PRESS}"},
-        (SHORT_PRESS, COMMAND_OFF): {COMMAND: f"{COMMAND_OFF}_{SHORT_PRESS}"},
-        (DOUBLE_PRESS, COMMAND_OFF): {COMMAND: f"{COMMAND_OFF}_{DOUBLE_PRESS}"},
-        (TRIPLE_PRESS, COMMAND_OFF): {COMMAND: f"{COMMAND_OFF}_{TRIPLE_PRESS}"},
-        (QUADRUPLE_PRESS, COMMAND_OFF): {COMMAND: f"{COMMAND_OFF}_{QUADRUPLE_PRESS}"},
-        (QUINTUPLE_PRESS, COMMAND_OFF): {COMMAND: f"{COMMAND_OFF}_{QUINTUPLE_PRESS}"},
-        (SHORT_PRESS, COMMAND_BUTTON_DOUBLE): {COMMAND: COMMAND_BUTTON_DOUBLE},
-        (DOUBLE_PRESS, COMMAND_BUTTON_DOUBLE): {COMMAND: f"{COMMAND_BUTTON_DOUBLE}_{DOUBLE_PRESS}"},
-        (TRIPLE_PRESS, COMMAND_BUTTON_DOUBLE): {COMMAND: f"{COMMAND_BUTTON_DOUBLE}_{TRIPLE_PRESS}"},
-        (SHORT_PRESS, "on_off"): {COMMAND: "on_off"},
-        (SHORT_PRESS, "off_on"): {COMMAND: "off_on"},
-        # Triple-click sequences (6 combinations - excluding same button sequences)
-        (SHORT_PRESS, "on_on_off"): {COMMAND: "on_on_off"},
-        (SHORT_PRESS, "on_off_on"): {COMMAND: "on_off_on"},
-        (SHORT_PRESS, "on_off_off"): {COMMAND: "on_off_off"},
-        (SHORT_PRESS, "off_on_on"): {COMMAND: "off_on_on"},
-        (SHORT_PRESS, "off_on_off"): {COMMAND: "off_on_off"},
-        (SHORT_PRESS, "off_off_on"): {COMMAND: "off_off_on"},
-    }
+    # Read-only, and command values share the string objects in EVENT_NAMES
+    # and SEQUENCE_EVENT_NAMES
+    device_automation_triggers = MappingProxyType({
+        # Single button clicks (1-5 presses on each button)
+        **{
+            (click_type, command): {COMMAND: EVENT_NAMES[button][count]}
+            for command, button in ((COMMAND_ON, ON_CODE), (COMMAND_OFF, OFF_CODE))
+            for count, click_type in enumerate(CLICK_TYPES)
+            if click_type
+        },
+        # Dual button clicks (1-3 presses)
+        **{
+            (click_type, COMMAND_BUTTON_DOUBLE): {COMMAND: EVENT_NAMES[DUAL_CODE][count]}
+            for count, click_type in enumerate(CLICK_TYPES[:4])
+            if click_type
+        },
+        # Two- and three-press sequences (excluding same button sequences)
+        **{
+            (SHORT_PRESS, event_name): {COMMAND: event_name}
+            for event_name in SEQUENCE_EVENT_NAMES.values()
+        },
+    })
@@ -15,6 +15,9 @@ class CustomSonoffCluster(CustomCluster):
 
     cluster_id = 0xFC11
 
+    # Attributs virtuels (min/max limit, virtual valve position)
+    _VIRTUAL_ATTRS = frozenset((0x7000, 0x7001, 0x7002))
+
     class AttributeDefs(BaseAttributeDefs):
         child_lock = ZCLAttributeDef(id=0x0000, type=t.Bool)
         open_window = ZCLAttributeDef(id=0x6000, type=t.Bool)
@@ -35,6 +38,13 @@ class CustomSonoffCluster(CustomCluster):
         valve_max_limit = ZCLAttributeDef(id=0x7001, type=t.uint8_t)
         virtual_valve_position = ZCLAttributeDef(id=0x7002, type=t.uint8_t)
 
+    # Nom -> id des attributs, pour les écritures par nom
+    _NAME_TO_ID = {
+        name: attr_def.id
+        for name, attr_def in vars(AttributeDefs).items()
+        if isinstance(attr_def, ZCLAttributeDef)
+    }
+
     @property
     def _is_manuf_specific(self):
         return False
@@ -46,6 +56,7 @@ class CustomSonoffCluster(CustomCluster):
         # Valeurs par défaut
         self._valve_min_limit = 0
         self._valve_max_limit = 100
+        self._recompute_span()
         
         # Initialiser le cache
         self._attr_cache[0x7000] = self._valve_min_limit
@@ -53,75 +64,100 @@ class CustomSonoffCluster(CustomCluster):
         self._attr_cache[0x7002] = 0
         
         _LOGGER.debug(
-            f"Initialized calibration for {self.endpoint.device.ieee}: "
-            f"min={self._valve_min_limit}%, max={self._valve_max_limit}%"
+            "Initialized calibration for %s: min=%s%%, max=%s%%",
+            self.endpoint.device.ieee, self._valve_min_limit, self._valve_max_limit,
         )
 
     async def write_attributes(self, attributes, manufacturer=None):
         """Intercept writes to handle virtual attributes."""
         processed_attrs = {}
         
-        for attr_id, value in attributes.items():
+        # Cas courant : un seul attribut, traité sans boucle
+        if len(attributes) == 1:
+            (attr_id, value), = attributes.items()
             if isinstance(attr_id, str):
-                attr_id = self.attributes_by_name[attr_id].id
-            
-            if attr_id == 0x7002:  # virtual_valve_position
-                real_value = self._virtual_to_real(value)
-                processed_attrs[0x600B] = real_value
-                processed_attrs[0x600C] = 100 - real_value
-                
-                # Notifier HA du changement
-                self._update_attribute(0x7002, value)
-                
-                _LOGGER.debug(
-                    f"Virtual {value}% → Real {real_value}% "
-                    f"(limits: {self._valve_min_limit}-{self._valve_max_limit}%)"
-                )
-                
-            elif attr_id == 0x7000:  # valve_min_limit
-                self._valve_min_limit = value
-                # Notifier HA pour persistance
-                self._update_attribute(0x7000, value)
-                _LOGGER.info(f"Set valve min limit to {value}%")
-                
-            elif attr_id == 0x7001:  # valve_max_limit
-                self._valve_max_limit = value
-                # Notifier HA pour persistance
-                self._update_attribute(0x7001, value)
-                _LOGGER.info(f"Set valve max limit to {value}%")
+                attr_id = self._NAME_TO_ID[attr_id]
+            if attr_id not in self._VIRTUAL_ATTRS:
+                # Attribut réel, transmis tel quel
+                return await super().write_attributes(attributes, manufacturer)
+            self._write_virtual_attribute(attr_id, value, processed_attrs)
+        
+        else:
+            for attr_id, value in attributes.items():
+                if isinstance(attr_id, str):
+                    attr_id = self._NAME_TO_ID[attr_id]
                 
-            else:
-                processed_attrs[attr_id] = value
+                if attr_id in self._VIRTUAL_ATTRS:
+                    self._write_virtual_attribute(attr_id, value, processed_attrs)
+                else:
+                    processed_attrs[attr_id] = value
         
+        # Un seul appel parent : ouverture/fermeture (0x600B/0x600C) et les
+        # autres attributs réels partent dans une même trame
         if processed_attrs:
             return await super().write_attributes(processed_attrs, manufacturer)
         
         return [[foundation.WriteAttributesStatusRecord(foundation.Status.SUCCESS)]]
 
+    def _write_virtual_attribute(self, attr_id, value, processed_attrs):
+        """Apply a virtual attribute write, adding any real writes it needs."""
+        if attr_id == 0x7002:  # virtual_valve_position
+            real_value = self._virtual_to_real(value)
+            processed_attrs[0x600B] = real_value
+            processed_attrs[0x600C] = 100 - real_value
+            
+            # Notifier HA du changement
+            self._update_attribute(0x7002, value)
+            
+            _LOGGER.debug(
+                "Virtual %s%% → Real %s%% (limits: %s-%s%%)",
+                value, real_value, self._valve_min_limit, self._valve_max_limit,
+            )
+            
+        elif attr_id == 0x7000:  # valve_min_limit
+            self._valve_min_limit = value
+            # Notifier HA pour persistance
+            self._update_attribute(0x7000, value)
+            _LOGGER.info("Set valve min limit to %s%%", value)
+            
+        elif attr_id == 0x7001:  # valve_max_limit
+            self._valve_max_limit = value
+            # Notifier HA pour persistance
+            self._update_attribute(0x7001, value)
+            _LOGGER.info("Set valve max limit to %s%%", value)
+
     async def read_attributes(self, attributes, manufacturer=None):
         """Intercept reads to handle virtual attributes."""
-        virtual_attrs = {0x7000, 0x7001, 0x7002}
-        real_attrs = [a for a in attributes if a not in virtual_attrs]
+        # Séparer attributs réels et virtuels en une seule passe
+        real_attrs = []
+        virtual_attrs = []
+        for attr_id in attributes:
+            if attr_id in self._VIRTUAL_ATTRS:
+                virtual_attrs.append(attr_id)
+            else:
+                real_attrs.append(attr_id)
         
         result = []
         if real_attrs:
             result = await super().read_attributes(real_attrs, manufacturer)
         
-        for attr_id in attributes:
-            if attr_id in virtual_attrs:
-                value = self._attr_cache.get(attr_id, 0)
-                result.append(
-                    foundation.ReadAttributeRecord(
-                        attr_id, foundation.Status.SUCCESS, 
-                        foundation.TypeValue(type=t.uint8_t, value=value)
-                    )
-                )
+        result.extend(
+            foundation.ReadAttributeRecord(
+                attr_id, foundation.Status.SUCCESS,
+                foundation.TypeValue(type=t.uint8_t, value=self._attr_cache.get(attr_id, 0))
+            )
+            for attr_id in virtual_attrs
+        )
         
         return result
 
+    def _recompute_span(self):
+        """Cache the calibrated range (max - min) used by the conversions."""
+        self._valve_span = self._valve_max_limit - self._valve_min_limit
+
     def _virtual_to_real(self, virtual_pos):
         """Convert virtual position (0-100) to real position (min-max)."""
-        if self._valve_max_limit == self._valve_min_limit:
+        if self._valve_span == 0:
             return self._valve_min_limit
         
         if virtual_pos == 0:
@@ -130,20 +166,26 @@ class CustomSonoffCluster(CustomCluster):
         if virtual_pos == 100:
             return 100
         
-        real = self._valve_min_limit + (virtual_pos / 100) * (
-            self._valve_max_limit - self._valve_min_limit
-        )
-        return max(self._valve_min_limit, min(int(real), self._valve_max_limit))
+        # Arithmétique entière : pas d'arrondi flottant avant la troncature
+        real = int(self._valve_min_limit + virtual_pos * self._valve_span // 100)
+        # Borner sans appeler min()/max() (le minimum l'emporte si min > max)
+        if real > self._valve_max_limit:
+            real = self._valve_max_limit
+        if real < self._valve_min_limit:
+            real = self._valve_min_limit
+        return real
 
     def _real_to_virtual(self, real_pos):
         """Convert real position to virtual position (0-100)."""
-        if self._valve_max_limit == self._valve_min_limit:
+        if self._valve_span == 0:
             return 0
         
-        virtual = ((real_pos - self._valve_min_limit) * 100) / (
-            self._valve_max_limit - self._valve_min_limit
-        )
-        return max(0, min(int(virtual), 100))
+        virtual = int((real_pos - self._valve_min_limit) * 100 // self._valve_span)
+        if virtual > 100:
+            return 100
+        if virtual < 0:
+            return 0
+        return virtual
 
     def _update_attribute(self, attrid, value):
         """Override to sync and persist virtual attributes."""
@@ -153,14 +195,16 @@ class CustomSonoffCluster(CustomCluster):
         # Synchroniser les limites internes
         if attrid == 0x7000:
             self._valve_min_limit = value
+            self._recompute_span()
         elif attrid == 0x7001:
             self._valve_max_limit = value
+            self._recompute_span()
         elif attrid == 0x600B:  # valve_opening_degree
             # Mettre à jour la position virtuelle
             virtual = self._real_to_virtual(value)
             if self._attr_cache.get(0x7002) != virtual:
-                self._attr_cache[0x7002] = virtual
-                # Appeler parent pour notifier HA
+                # Une seule notification HA par rapport : le parent met aussi
+                # à jour le cache de 0x7002 (celui de 0x600B l'est déjà)
                 super()._update_attribute(0x7002, virtual)
                 return  # Éviter double notification
         
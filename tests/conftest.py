@@ -0,0 +1,17 @@
+"""Shared pytest configuration for the quirk tests."""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add parent directory to path to import the quirk modules
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+
+@pytest.fixture(scope="session")
+def rodret_triggers():
+    """Device automation triggers of the RODRET quirk (read-only, shared)."""
+    from ikea_rodret import IkeaRodretRemoteMultiClick
+
+    return IkeaRodretRemoteMultiClick.device_automation_triggers
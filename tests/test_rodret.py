@@ -12,6 +12,7 @@ Test Organization:
 - Edge Cases: Timer cancellation, rapid presses, boundary conditions
 - Robustness Tests: Stress testing with rapid/mixed patterns
 - Negative Tests: Verify correct event names and no duplicates
+- Real Loop Test: Smoke test of the running event loop and its timers
 
 Test Coverage:
 - Single button clicks: 1-5+ presses on ON and OFF buttons
@@ -23,13 +24,11 @@ Test Coverage:
 """
 
 import asyncio
+import heapq
+import itertools
 import pytest
-from unittest.mock import Mock, MagicMock
-import sys
-from pathlib import Path
-
-# Add parent directory to path to import ikea_rodret
-sys.path.insert(0, str(Path(__file__).parent.parent))
+from collections import namedtuple
+from types import SimpleNamespace
 
 from ikea_rodret import MultiClickOnOffCluster
 from zhaquirks.const import (
@@ -51,59 +50,145 @@ QUICK_PRESS_INTERVAL = 0.005  # Time between rapid presses
 MINIMAL_PRESS_INTERVAL = 0.001  # Minimal interval for stress testing
 WAIT_FOR_EVENT = TEST_CLICK_TIMEOUT + MINIMAL_PRESS_INTERVAL  # Wait for event emission after timeout
 
+# Endpoint of the simulated remote (only device.ieee is read)
+ENDPOINT = SimpleNamespace(device=SimpleNamespace(ieee="00:11:22:33:44:55:66:77"))
+
+# Cluster request header (only command_id is read), one shared instance per command
+Header = namedtuple("Header", "command_id")
+HEADERS = {command_id: Header(command_id) for command_id in (ON_COMMAND_ID, OFF_COMMAND_ID)}
+
+# Expected device automation triggers as (click type, command, emitted event name)
+TRIGGER_CASES = [
+    # Single button clicks (1-5 presses on each button)
+    *(
+        (click_type, command, f"{command}_{click_type}")
+        for command in (COMMAND_ON, COMMAND_OFF)
+        for click_type in (SHORT_PRESS, DOUBLE_PRESS, TRIPLE_PRESS, QUADRUPLE_PRESS, QUINTUPLE_PRESS)
+    ),
+    # Dual button clicks (1-3 presses)
+    (SHORT_PRESS, COMMAND_BUTTON_DOUBLE, COMMAND_BUTTON_DOUBLE),
+    (DOUBLE_PRESS, COMMAND_BUTTON_DOUBLE, f"{COMMAND_BUTTON_DOUBLE}_{DOUBLE_PRESS}"),
+    (TRIPLE_PRESS, COMMAND_BUTTON_DOUBLE, f"{COMMAND_BUTTON_DOUBLE}_{TRIPLE_PRESS}"),
+    # Two-button sequences
+    (SHORT_PRESS, "on_off", "on_off"),
+    (SHORT_PRESS, "off_on", "off_on"),
+    # Three-button sequences (6 combinations - excluding same button)
+    (SHORT_PRESS, "on_on_off", "on_on_off"),
+    (SHORT_PRESS, "on_off_on", "on_off_on"),
+    (SHORT_PRESS, "on_off_off", "on_off_off"),
+    (SHORT_PRESS, "off_on_on", "off_on_on"),
+    (SHORT_PRESS, "off_on_off", "off_on_off"),
+    (SHORT_PRESS, "off_off_on", "off_off_on"),
+]
+EXPECTED_KEYS = frozenset((click_type, command) for click_type, command, _ in TRIGGER_CASES)
+
+# 5 single button clicks × 2 buttons = 10
+# 3 dual button clicks = 3
+# 2 two-button sequences = 2
+# 6 three-button sequences (excluding same button) = 6
+EXPECTED_TOTAL_TRIGGERS = 21
+
+
+class FakeTimerHandle:
+    """Cancellable callback scheduled on a FakeLoop."""
+    
+    def __init__(self, callback, args):
+        self.callback = callback
+        self.args = args
+        self.cancelled = False
+    
+    def cancel(self):
+        self.cancelled = True
+
+
+class FakeLoop:
+    """Event loop stand-in whose clock only moves when advanced.
+    
+    Provides the time() and call_later() methods used by the cluster, so
+    tests can step through click timeouts without sleeping.
+    """
+    
+    def __init__(self):
+        self._time = 0.0
+        self._scheduled = []  # heap of (deadline, sequence, handle)
+        self._sequence = itertools.count()
+    
+    def time(self):
+        return self._time
+    
+    def call_later(self, delay, callback, *args):
+        handle = FakeTimerHandle(callback, args)
+        heapq.heappush(self._scheduled, (self._time + delay, next(self._sequence), handle))
+        return handle
+    
+    def advance(self, seconds):
+        """Move the clock forward, running callbacks that fall due in order."""
+        deadline = self._time + seconds
+        while self._scheduled and self._scheduled[0][0] <= deadline:
+            when, _, handle = heapq.heappop(self._scheduled)
+            self._time = when
+            if not handle.cancelled:
+                handle.callback(*handle.args)
+        self._time = deadline
+
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def cluster():
-    """Create a cluster instance with mocked dependencies for testing.
+    """Create a cluster instance with simulated dependencies, shared by the module.
     
     Sets up a MultiClickOnOffCluster with:
+    - Simulated endpoint for device identification
     - Initialized click tracking state
-    - Mocked listener_event for capturing emitted events
-    - Mocked endpoint for device identification
+    - listener_event recording emitted events into cluster.emitted_events
     - Custom faster timeouts for quicker tests
+    
+    Per-test state is cleared by the reset_cluster fixture.
     """
     cluster = MultiClickOnOffCluster.__new__(MultiClickOnOffCluster)
     
+    # Endpoint for device identification
+    cluster.__dict__['_endpoint'] = ENDPOINT
+    
     # Initialize click tracking state
-    cluster._click_count = {"on": 0, "off": 0, "dual": 0}
-    cluster._click_timer = {"on": None, "off": None, "dual": None}
-    cluster._last_button_press = {"on": None, "off": None}
-    cluster._last_dual_press = None
+    cluster._init_click_state()
     
     # Set custom faster timeouts for testing
     cluster.click_timeout = TEST_CLICK_TIMEOUT
     cluster.dual_button_timeout = TEST_DUAL_BUTTON_TIMEOUT
     
-    # Mock event listener
-    cluster.listener_event = Mock()
-    
-    # Mock endpoint for device identification
-    cluster.__dict__['_endpoint'] = MagicMock()
-    cluster.__dict__['_endpoint'].device = MagicMock()
-    cluster.__dict__['_endpoint'].device.ieee = "00:11:22:33:44:55:66:77"
+    # Record listener events as (event, *args) tuples
+    cluster.emitted_events = []
+    cluster.listener_event = lambda *args: cluster.emitted_events.append(args)
     
     return cluster
 
 
+@pytest.fixture(autouse=True)
+def reset_cluster(cluster):
+    """Clear click tracking state and recorded events before each test."""
+    cluster._init_click_state()
+    cluster.emitted_events.clear()
+    # Drive the cluster's timers from a fake clock instead of real sleeps
+    cluster._loop = FakeLoop()
+
+
 class TestHelpers:
     """Helper methods for test setup and assertions."""
     
     @staticmethod
     def create_header(command_id):
-        """Create a mock cluster request header.
+        """Get the cluster request header for a command.
         
         Args:
             command_id: The ZigBee command ID (0x00 for OFF, 0x01 for ON)
             
         Returns:
-            MagicMock: Header object with command_id attribute
+            Header: Header object with command_id attribute
         """
-        hdr = MagicMock()
-        hdr.command_id = command_id
-        return hdr
+        return HEADERS[command_id]
     
     @staticmethod
-    async def press_button(cluster, command_id):
+    def press_button(cluster, command_id):
         """Simulate a button press via cluster request.
         
         Args:
@@ -115,9 +200,34 @@ class TestHelpers:
         assert result is None, "Cluster request should suppress default processing"
     
     @staticmethod
-    async def wait_for_event():
+    def press_sequence(cluster, command_ids, interval=QUICK_PRESS_INTERVAL):
+        """Simulate a series of button presses separated by a fixed interval.
+        
+        Args:
+            cluster: The cluster instance
+            command_ids: The buttons to press, in order
+            interval: Time between consecutive presses
+        """
+        first, *rest = command_ids
+        TestHelpers.press_button(cluster, first)
+        for command_id in rest:
+            TestHelpers.advance(cluster, interval)
+            TestHelpers.press_button(cluster, command_id)
+    
+    @staticmethod
+    def advance(cluster, seconds):
+        """Let time pass on the cluster's fake clock, firing due timers.
+        
+        Args:
+            cluster: The cluster instance
+            seconds: How far to move the clock forward
+        """
+        cluster._loop.advance(seconds)
+    
+    @staticmethod
+    def wait_for_event(cluster):
         """Wait for event emission after click timeout."""
-        await asyncio.sleep(WAIT_FOR_EVENT)
+        TestHelpers.advance(cluster, WAIT_FOR_EVENT)
     
     @staticmethod
     def assert_event_emitted(cluster, expected_event, call_index=0):
@@ -128,10 +238,10 @@ class TestHelpers:
             expected_event: Exact event name to match
             call_index: Which call to check (0 for first, 1 for second, etc.)
         """
-        assert cluster.listener_event.call_count > call_index, \
-            f"Expected at least {call_index + 1} calls, got {cluster.listener_event.call_count}"
+        assert len(cluster.emitted_events) > call_index, \
+            f"Expected at least {call_index + 1} calls, got {len(cluster.emitted_events)}"
         
-        call_args = cluster.listener_event.call_args_list[call_index][0]
+        call_args = cluster.emitted_events[call_index]
         
         # Verify first argument is ZHA_SEND_EVENT
         assert call_args[0] == ZHA_SEND_EVENT, \
@@ -150,8 +260,8 @@ class TestHelpers:
             cluster: The cluster instance
             expected_count: Expected number of listener_event calls
         """
-        assert cluster.listener_event.call_count == expected_count, \
-            f"Expected {expected_count} events, got {cluster.listener_event.call_count}"
+        assert len(cluster.emitted_events) == expected_count, \
+            f"Expected {expected_count} events, got {len(cluster.emitted_events)}"
     
     @staticmethod
     def get_event_name(cluster, call_index=0):
@@ -164,138 +274,81 @@ class TestHelpers:
         Returns:
             str: The event name
         """
-        return cluster.listener_event.call_args_list[call_index][0][1]
+        return cluster.emitted_events[call_index][1]
 
 
 class TestSingleButtonPresses:
     """Tests for single button press detection (1-5 clicks)."""
     
-    @pytest.mark.asyncio
-    async def test_single_on_press(self, cluster):
+    def test_single_on_press(self, cluster):
         """Single ON button press should emit short press event."""
-        await TestHelpers.press_button(cluster, ON_COMMAND_ID)
-        await TestHelpers.wait_for_event()
+        TestHelpers.press_button(cluster, ON_COMMAND_ID)
+        TestHelpers.wait_for_event(cluster)
         
         TestHelpers.assert_event_emitted(cluster, "on_remote_button_short_press")
         TestHelpers.assert_event_count(cluster, 1)
     
-    @pytest.mark.asyncio
-    async def test_single_off_press(self, cluster):
+    def test_single_off_press(self, cluster):
         """Single OFF button press should emit short press event."""
-        await TestHelpers.press_button(cluster, OFF_COMMAND_ID)
-        await TestHelpers.wait_for_event()
+        TestHelpers.press_button(cluster, OFF_COMMAND_ID)
+        TestHelpers.wait_for_event(cluster)
         
         TestHelpers.assert_event_emitted(cluster, "off_remote_button_short_press")
         TestHelpers.assert_event_count(cluster, 1)
     
-    @pytest.mark.asyncio
-    @pytest.mark.parametrize("button_id,button_name", [
-        (ON_COMMAND_ID, "on"),
-        (OFF_COMMAND_ID, "off"),
-    ])
-    async def test_double_press(self, cluster, button_id, button_name):
-        """Two rapid presses should emit double press event."""
-        await TestHelpers.press_button(cluster, button_id)
-        await asyncio.sleep(QUICK_PRESS_INTERVAL)
-        await TestHelpers.press_button(cluster, button_id)
-        await TestHelpers.wait_for_event()
-        
-        TestHelpers.assert_event_emitted(cluster, f"{button_name}_remote_button_double_press")
-        TestHelpers.assert_event_count(cluster, 1)
-    
-    @pytest.mark.asyncio
-    @pytest.mark.parametrize("button_id,button_name", [
-        (ON_COMMAND_ID, "on"),
-        (OFF_COMMAND_ID, "off"),
-    ])
-    async def test_triple_press(self, cluster, button_id, button_name):
-        """Three rapid presses should emit triple press event."""
-        for _ in range(3):
-            await TestHelpers.press_button(cluster, button_id)
-            await asyncio.sleep(QUICK_PRESS_INTERVAL)
-        await TestHelpers.wait_for_event()
-        
-        TestHelpers.assert_event_emitted(cluster, f"{button_name}_remote_button_triple_press")
-        TestHelpers.assert_event_count(cluster, 1)
-    
-    @pytest.mark.asyncio
     @pytest.mark.parametrize("button_id,button_name", [
         (ON_COMMAND_ID, "on"),
         (OFF_COMMAND_ID, "off"),
     ])
-    async def test_quadruple_press(self, cluster, button_id, button_name):
-        """Four rapid presses should emit quadruple press event."""
-        for _ in range(4):
-            await TestHelpers.press_button(cluster, button_id)
-            await asyncio.sleep(QUICK_PRESS_INTERVAL)
-        await TestHelpers.wait_for_event()
-        
-        TestHelpers.assert_event_emitted(cluster, f"{button_name}_remote_button_quadruple_press")
-        TestHelpers.assert_event_count(cluster, 1)
-    
-    @pytest.mark.asyncio
-    @pytest.mark.parametrize("button_id,button_name", [
-        (ON_COMMAND_ID, "on"),
-        (OFF_COMMAND_ID, "off"),
+    @pytest.mark.parametrize("presses,click_type", [
+        (2, DOUBLE_PRESS),
+        (3, TRIPLE_PRESS),
+        (4, QUADRUPLE_PRESS),
+        (5, QUINTUPLE_PRESS),
+        (6, QUINTUPLE_PRESS),  # six or more presses are capped at quintuple
     ])
-    async def test_quintuple_press(self, cluster, button_id, button_name):
-        """Five rapid presses should emit quintuple press event."""
-        for _ in range(5):
-            await TestHelpers.press_button(cluster, button_id)
-            await asyncio.sleep(QUICK_PRESS_INTERVAL)
-        await TestHelpers.wait_for_event()
-        
-        TestHelpers.assert_event_emitted(cluster, f"{button_name}_remote_button_quintuple_press")
-        TestHelpers.assert_event_count(cluster, 1)
-    
-    @pytest.mark.asyncio
-    async def test_six_presses_treated_as_quintuple(self, cluster):
-        """Six or more presses should emit quintuple press event (max)."""
-        for _ in range(6):
-            await TestHelpers.press_button(cluster, ON_COMMAND_ID)
-            await asyncio.sleep(QUICK_PRESS_INTERVAL)
-        await TestHelpers.wait_for_event()
-        
-        TestHelpers.assert_event_emitted(cluster, "on_remote_button_quintuple_press")
+    def test_multi_press(self, cluster, button_id, button_name, presses, click_type):
+        """N rapid presses should emit the matching multi-press event."""
+        TestHelpers.press_sequence(cluster, [button_id] * presses)
+        TestHelpers.wait_for_event(cluster)
+        
+        TestHelpers.assert_event_emitted(cluster, f"{button_name}_{click_type}")
         TestHelpers.assert_event_count(cluster, 1)
 
 
 class TestMultiButtonPresses:
     """Tests for multi-button press detection."""
     
-    @pytest.mark.asyncio
-    async def test_simultaneous_buttons_on_first(self, cluster):
+    def test_simultaneous_buttons_on_first(self, cluster):
         """Pressing ON then OFF within DUAL_BUTTON_TIMEOUT should emit dual button event."""
-        await TestHelpers.press_button(cluster, ON_COMMAND_ID)
-        await asyncio.sleep(QUICK_PRESS_INTERVAL)
-        await TestHelpers.press_button(cluster, OFF_COMMAND_ID)
-        await TestHelpers.wait_for_event()
+        TestHelpers.press_button(cluster, ON_COMMAND_ID)
+        TestHelpers.advance(cluster, QUICK_PRESS_INTERVAL)
+        TestHelpers.press_button(cluster, OFF_COMMAND_ID)
+        TestHelpers.wait_for_event(cluster)
         
         TestHelpers.assert_event_emitted(cluster, "button_double")
         TestHelpers.assert_event_count(cluster, 1)
     
-    @pytest.mark.asyncio
-    async def test_simultaneous_buttons_off_first(self, cluster):
+    def test_simultaneous_buttons_off_first(self, cluster):
         """Pressing OFF then ON within DUAL_BUTTON_TIMEOUT should emit dual button event."""
-        await TestHelpers.press_button(cluster, OFF_COMMAND_ID)
-        await asyncio.sleep(QUICK_PRESS_INTERVAL)
-        await TestHelpers.press_button(cluster, ON_COMMAND_ID)
-        await TestHelpers.wait_for_event()
+        TestHelpers.press_button(cluster, OFF_COMMAND_ID)
+        TestHelpers.advance(cluster, QUICK_PRESS_INTERVAL)
+        TestHelpers.press_button(cluster, ON_COMMAND_ID)
+        TestHelpers.wait_for_event(cluster)
         
         TestHelpers.assert_event_emitted(cluster, "button_double")
         TestHelpers.assert_event_count(cluster, 1)
     
-    @pytest.mark.asyncio
-    async def test_slow_button_presses_emit_separate_events(self, cluster):
+    def test_slow_button_presses_emit_separate_events(self, cluster):
         """Pressing buttons with long delays should emit separate single press events."""
-        await TestHelpers.press_button(cluster, ON_COMMAND_ID)
-        await TestHelpers.wait_for_event()
-        first_call_count = cluster.listener_event.call_count
+        TestHelpers.press_button(cluster, ON_COMMAND_ID)
+        TestHelpers.wait_for_event(cluster)
+        first_call_count = len(cluster.emitted_events)
         
-        await TestHelpers.press_button(cluster, OFF_COMMAND_ID)
-        await TestHelpers.wait_for_event()
+        TestHelpers.press_button(cluster, OFF_COMMAND_ID)
+        TestHelpers.wait_for_event(cluster)
         
-        assert cluster.listener_event.call_count == first_call_count + 1
+        assert len(cluster.emitted_events) == first_call_count + 1
         TestHelpers.assert_event_emitted(cluster, "on_remote_button_short_press", call_index=0)
         TestHelpers.assert_event_emitted(cluster, "off_remote_button_short_press", call_index=1)
 
@@ -303,65 +356,46 @@ class TestMultiButtonPresses:
 class TestDualButtonPresses:
     """Tests for dual button (simultaneous) press detection."""
     
-    @pytest.mark.asyncio
-    async def test_dual_button_single_press(self, cluster):
+    def test_dual_button_single_press(self, cluster):
         """Single simultaneous button press should emit dual button event."""
-        await TestHelpers.press_button(cluster, ON_COMMAND_ID)
-        await asyncio.sleep(QUICK_PRESS_INTERVAL)
-        await TestHelpers.press_button(cluster, OFF_COMMAND_ID)
-        await TestHelpers.wait_for_event()
+        TestHelpers.press_button(cluster, ON_COMMAND_ID)
+        TestHelpers.advance(cluster, QUICK_PRESS_INTERVAL)
+        TestHelpers.press_button(cluster, OFF_COMMAND_ID)
+        TestHelpers.wait_for_event(cluster)
         
         TestHelpers.assert_event_emitted(cluster, "button_double")
         TestHelpers.assert_event_count(cluster, 1)
     
-    @pytest.mark.asyncio
-    async def test_dual_button_double_press(self, cluster):
-        """Two rapid simultaneous button press sequences should emit dual button double press."""
-        for _ in range(2):
-            await TestHelpers.press_button(cluster, ON_COMMAND_ID)
-            await asyncio.sleep(QUICK_PRESS_INTERVAL)
-            await TestHelpers.press_button(cluster, OFF_COMMAND_ID)
-            await asyncio.sleep(QUICK_PRESS_INTERVAL)
-        
-        await TestHelpers.wait_for_event()
-        
-        TestHelpers.assert_event_emitted(cluster, "button_double_remote_button_double_press")
-        TestHelpers.assert_event_count(cluster, 1)
-    
-    @pytest.mark.asyncio
-    async def test_dual_button_triple_press(self, cluster):
-        """Three rapid simultaneous button press sequences should emit dual button triple press."""
-        for _ in range(3):
-            await TestHelpers.press_button(cluster, ON_COMMAND_ID)
-            await asyncio.sleep(QUICK_PRESS_INTERVAL)
-            await TestHelpers.press_button(cluster, OFF_COMMAND_ID)
-            await asyncio.sleep(QUICK_PRESS_INTERVAL)
-        
-        await TestHelpers.wait_for_event()
+    @pytest.mark.parametrize("repeats,click_type", [
+        (2, DOUBLE_PRESS),
+        (3, TRIPLE_PRESS),
+    ])
+    def test_dual_button_multi_press(self, cluster, repeats, click_type):
+        """Repeated rapid simultaneous button presses should emit a dual button multi-press."""
+        TestHelpers.press_sequence(cluster, [ON_COMMAND_ID, OFF_COMMAND_ID] * repeats)
+        TestHelpers.wait_for_event(cluster)
         
-        TestHelpers.assert_event_emitted(cluster, "button_double_remote_button_triple_press")
+        TestHelpers.assert_event_emitted(cluster, f"{COMMAND_BUTTON_DOUBLE}_{click_type}")
         TestHelpers.assert_event_count(cluster, 1)
 
 
 class TestTimingBoundaries:
     """Tests for timing boundary conditions."""
     
-    @pytest.mark.asyncio
-    async def test_dual_button_timeout_boundary_under(self, cluster):
+    def test_dual_button_timeout_boundary_under(self, cluster):
         """Presses just under DUAL_BUTTON_TIMEOUT should be detected as dual button."""
-        await TestHelpers.press_button(cluster, ON_COMMAND_ID)
-        await asyncio.sleep(TEST_DUAL_BUTTON_TIMEOUT - QUICK_PRESS_INTERVAL)
-        await TestHelpers.press_button(cluster, OFF_COMMAND_ID)
-        await TestHelpers.wait_for_event()
+        TestHelpers.press_button(cluster, ON_COMMAND_ID)
+        TestHelpers.advance(cluster, TEST_DUAL_BUTTON_TIMEOUT - QUICK_PRESS_INTERVAL)
+        TestHelpers.press_button(cluster, OFF_COMMAND_ID)
+        TestHelpers.wait_for_event(cluster)
         
         TestHelpers.assert_event_emitted(cluster, "button_double")
         TestHelpers.assert_event_count(cluster, 1)
     
-    @pytest.mark.asyncio
-    async def test_click_timeout_boundary(self, cluster):
+    def test_click_timeout_boundary(self, cluster):
         """Presses at exact CLICK_TIMEOUT should still emit event."""
-        await TestHelpers.press_button(cluster, ON_COMMAND_ID)
-        await asyncio.sleep(TEST_CLICK_TIMEOUT + QUICK_PRESS_INTERVAL)
+        TestHelpers.press_button(cluster, ON_COMMAND_ID)
+        TestHelpers.advance(cluster, TEST_CLICK_TIMEOUT + QUICK_PRESS_INTERVAL)
         
         # Event should be emitted after timeout
         TestHelpers.assert_event_emitted(cluster, "on_remote_button_short_press")
@@ -371,48 +405,45 @@ class TestTimingBoundaries:
 class TestEdgeCases:
     """Tests for edge cases and special scenarios."""
     
-    @pytest.mark.asyncio
-    async def test_rapid_alternating_presses(self, cluster):
+    def test_rapid_alternating_presses(self, cluster):
         """Rapid alternating ON-OFF-ON presses should detect dual button."""
-        await TestHelpers.press_button(cluster, ON_COMMAND_ID)
-        await asyncio.sleep(QUICK_PRESS_INTERVAL)
-        await TestHelpers.press_button(cluster, OFF_COMMAND_ID)
-        await asyncio.sleep(QUICK_PRESS_INTERVAL)
-        await TestHelpers.press_button(cluster, ON_COMMAND_ID)
-        await TestHelpers.wait_for_event()
+        TestHelpers.press_button(cluster, ON_COMMAND_ID)
+        TestHelpers.advance(cluster, QUICK_PRESS_INTERVAL)
+        TestHelpers.press_button(cluster, OFF_COMMAND_ID)
+        TestHelpers.advance(cluster, QUICK_PRESS_INTERVAL)
+        TestHelpers.press_button(cluster, ON_COMMAND_ID)
+        TestHelpers.wait_for_event(cluster)
         
         # Should detect dual button press (first ON-OFF), then another ON
         # The exact behavior depends on implementation
-        assert cluster.listener_event.call_count >= 1
+        assert len(cluster.emitted_events) >= 1
     
-    @pytest.mark.asyncio
-    async def test_minimal_interval_presses(self, cluster):
+    def test_minimal_interval_presses(self, cluster):
         """Presses with minimal interval should still be detected as rapid."""
-        await TestHelpers.press_button(cluster, ON_COMMAND_ID)
-        await asyncio.sleep(MINIMAL_PRESS_INTERVAL)
-        await TestHelpers.press_button(cluster, ON_COMMAND_ID)
-        await TestHelpers.wait_for_event()
+        TestHelpers.press_button(cluster, ON_COMMAND_ID)
+        TestHelpers.advance(cluster, MINIMAL_PRESS_INTERVAL)
+        TestHelpers.press_button(cluster, ON_COMMAND_ID)
+        TestHelpers.wait_for_event(cluster)
         
         TestHelpers.assert_event_emitted(cluster, "on_remote_button_double_press")
         TestHelpers.assert_event_count(cluster, 1)
     
-    @pytest.mark.asyncio
-    async def test_back_to_back_sequences(self, cluster):
+    def test_back_to_back_sequences(self, cluster):
         """Multiple sequences back-to-back should emit independent events."""
         # First sequence: double click
-        await TestHelpers.press_button(cluster, ON_COMMAND_ID)
-        await asyncio.sleep(QUICK_PRESS_INTERVAL)
-        await TestHelpers.press_button(cluster, ON_COMMAND_ID)
-        await TestHelpers.wait_for_event()
+        TestHelpers.press_button(cluster, ON_COMMAND_ID)
+        TestHelpers.advance(cluster, QUICK_PRESS_INTERVAL)
+        TestHelpers.press_button(cluster, ON_COMMAND_ID)
+        TestHelpers.wait_for_event(cluster)
         
-        first_count = cluster.listener_event.call_count
+        first_count = len(cluster.emitted_events)
         
         # Second sequence: single click
-        await TestHelpers.press_button(cluster, OFF_COMMAND_ID)
-        await TestHelpers.wait_for_event()
+        TestHelpers.press_button(cluster, OFF_COMMAND_ID)
+        TestHelpers.wait_for_event(cluster)
         
         # Should have two separate events
-        assert cluster.listener_event.call_count == first_count + 1
+        assert len(cluster.emitted_events) == first_count + 1
         assert "double_press" in TestHelpers.get_event_name(cluster, 0)
         assert "short_press" in TestHelpers.get_event_name(cluster, 1)
 
@@ -420,134 +451,123 @@ class TestEdgeCases:
 class TestStateManagement:
     """Tests for internal state management."""
     
-    @pytest.mark.asyncio
-    async def test_state_reset_after_event(self, cluster):
+    def test_state_reset_after_event(self, cluster):
         """State should be reset after event emission."""
-        await TestHelpers.press_button(cluster, ON_COMMAND_ID)
-        await TestHelpers.wait_for_event()
+        TestHelpers.press_button(cluster, ON_COMMAND_ID)
+        TestHelpers.wait_for_event(cluster)
         
         # Event should be emitted
         TestHelpers.assert_event_count(cluster, 1)
     
-    @pytest.mark.asyncio
-    async def test_independent_button_sequences(self, cluster):
+    def test_independent_button_sequences(self, cluster):
         """Multiple button sequences should be independent."""
-        await TestHelpers.press_button(cluster, ON_COMMAND_ID)
-        await TestHelpers.wait_for_event()
+        TestHelpers.press_button(cluster, ON_COMMAND_ID)
+        TestHelpers.wait_for_event(cluster)
         
-        first_call_count = cluster.listener_event.call_count
+        first_call_count = len(cluster.emitted_events)
         
-        await TestHelpers.press_button(cluster, OFF_COMMAND_ID)
-        await TestHelpers.wait_for_event()
+        TestHelpers.press_button(cluster, OFF_COMMAND_ID)
+        TestHelpers.wait_for_event(cluster)
         
-        assert cluster.listener_event.call_count == first_call_count + 1
+        assert len(cluster.emitted_events) == first_call_count + 1
         TestHelpers.assert_event_emitted(cluster, "on_remote_button_short_press", call_index=0)
         TestHelpers.assert_event_emitted(cluster, "off_remote_button_short_press", call_index=1)
     
-    @pytest.mark.asyncio
-    async def test_dual_button_state_reset(self, cluster):
+    def test_dual_button_state_reset(self, cluster):
         """Dual button state should be reset after event emission."""
-        await TestHelpers.press_button(cluster, ON_COMMAND_ID)
-        await asyncio.sleep(QUICK_PRESS_INTERVAL)
-        await TestHelpers.press_button(cluster, OFF_COMMAND_ID)
-        await TestHelpers.wait_for_event()
+        TestHelpers.press_button(cluster, ON_COMMAND_ID)
+        TestHelpers.advance(cluster, QUICK_PRESS_INTERVAL)
+        TestHelpers.press_button(cluster, OFF_COMMAND_ID)
+        TestHelpers.wait_for_event(cluster)
         
         # Event should be emitted
         TestHelpers.assert_event_count(cluster, 1)
     
-    @pytest.mark.asyncio
-    async def test_individual_button_state_independence(self, cluster):
+    def test_individual_button_state_independence(self, cluster):
         """ON and OFF button states should be independent."""
         # Press ON multiple times
-        for _ in range(3):
-            await TestHelpers.press_button(cluster, ON_COMMAND_ID)
-            await asyncio.sleep(QUICK_PRESS_INTERVAL)
-        await TestHelpers.wait_for_event()
+        TestHelpers.press_sequence(cluster, [ON_COMMAND_ID] * 3)
+        TestHelpers.wait_for_event(cluster)
         
-        first_count = cluster.listener_event.call_count
+        first_count = len(cluster.emitted_events)
         
         # Press OFF
-        await TestHelpers.press_button(cluster, OFF_COMMAND_ID)
-        await TestHelpers.wait_for_event()
+        TestHelpers.press_button(cluster, OFF_COMMAND_ID)
+        TestHelpers.wait_for_event(cluster)
         
         # Should have two separate events
-        assert cluster.listener_event.call_count == first_count + 1
+        assert len(cluster.emitted_events) == first_count + 1
 
 
 class TestSequentialPresses:
     """Tests for sequential button press detection (ON→OFF or OFF→ON)."""
     
-    @pytest.mark.asyncio
-    async def test_on_then_off_sequential(self, cluster):
+    def test_on_then_off_sequential(self, cluster):
         """ON button followed by OFF button within timing window should emit on_off event."""
         # Press ON
-        await TestHelpers.press_button(cluster, ON_COMMAND_ID)
-        await asyncio.sleep(TEST_DUAL_BUTTON_TIMEOUT + QUICK_PRESS_INTERVAL)
+        TestHelpers.press_button(cluster, ON_COMMAND_ID)
+        TestHelpers.advance(cluster, TEST_DUAL_BUTTON_TIMEOUT + QUICK_PRESS_INTERVAL)
         
         # Press OFF within CLICK_TIMEOUT but after DUAL_BUTTON_TIMEOUT
-        await TestHelpers.press_button(cluster, OFF_COMMAND_ID)
-        await TestHelpers.wait_for_event()
+        TestHelpers.press_button(cluster, OFF_COMMAND_ID)
+        TestHelpers.wait_for_event(cluster)
         
         # Should emit sequential event
         TestHelpers.assert_event_emitted(cluster, "on_off")
         TestHelpers.assert_event_count(cluster, 1)
     
-    @pytest.mark.asyncio
-    async def test_off_then_on_sequential(self, cluster):
+    def test_off_then_on_sequential(self, cluster):
         """OFF button followed by ON button within timing window should emit off_on event."""
         # Press OFF
-        await TestHelpers.press_button(cluster, OFF_COMMAND_ID)
-        await asyncio.sleep(TEST_DUAL_BUTTON_TIMEOUT + QUICK_PRESS_INTERVAL)
+        TestHelpers.press_button(cluster, OFF_COMMAND_ID)
+        TestHelpers.advance(cluster, TEST_DUAL_BUTTON_TIMEOUT + QUICK_PRESS_INTERVAL)
         
         # Press ON within CLICK_TIMEOUT but after DUAL_BUTTON_TIMEOUT
-        await TestHelpers.press_button(cluster, ON_COMMAND_ID)
-        await TestHelpers.wait_for_event()
+        TestHelpers.press_button(cluster, ON_COMMAND_ID)
+        TestHelpers.wait_for_event(cluster)
         
         # Should emit sequential event
         TestHelpers.assert_event_emitted(cluster, "off_on")
         TestHelpers.assert_event_count(cluster, 1)
     
-    @pytest.mark.asyncio
-    async def test_sequential_event_exact_name(self, cluster):
+    def test_sequential_event_exact_name(self, cluster):
         """Sequential events should have exact event names."""
         # Test on_off
-        await TestHelpers.press_button(cluster, ON_COMMAND_ID)
-        await asyncio.sleep(TEST_DUAL_BUTTON_TIMEOUT + QUICK_PRESS_INTERVAL)
-        await TestHelpers.press_button(cluster, OFF_COMMAND_ID)
-        await TestHelpers.wait_for_event()
+        TestHelpers.press_button(cluster, ON_COMMAND_ID)
+        TestHelpers.advance(cluster, TEST_DUAL_BUTTON_TIMEOUT + QUICK_PRESS_INTERVAL)
+        TestHelpers.press_button(cluster, OFF_COMMAND_ID)
+        TestHelpers.wait_for_event(cluster)
         
         event_name = TestHelpers.get_event_name(cluster, 0)
         assert event_name == "on_off", f"Expected 'on_off', got '{event_name}'"
     
-    @pytest.mark.asyncio
-    async def test_sequential_not_emitted_if_too_slow(self, cluster):
+    def test_sequential_not_emitted_if_too_slow(self, cluster):
         """Presses beyond CLICK_TIMEOUT should not emit sequential event."""
         # Press ON
-        await TestHelpers.press_button(cluster, ON_COMMAND_ID)
-        await TestHelpers.wait_for_event()
-        first_count = cluster.listener_event.call_count
+        TestHelpers.press_button(cluster, ON_COMMAND_ID)
+        TestHelpers.wait_for_event(cluster)
+        first_count = len(cluster.emitted_events)
         
         # Press OFF after CLICK_TIMEOUT (too slow for sequential)
-        await TestHelpers.press_button(cluster, OFF_COMMAND_ID)
-        await TestHelpers.wait_for_event()
+        TestHelpers.press_button(cluster, OFF_COMMAND_ID)
+        TestHelpers.wait_for_event(cluster)
         
         # Should emit two separate single press events, not sequential
-        assert cluster.listener_event.call_count == first_count + 1
+        assert len(cluster.emitted_events) == first_count + 1
         # First event should be on_short_press
         assert "on_remote_button_short_press" in TestHelpers.get_event_name(cluster, 0)
         # Second event should be off_short_press
         assert "off_remote_button_short_press" in TestHelpers.get_event_name(cluster, 1)
     
-    @pytest.mark.asyncio
-    async def test_sequential_not_emitted_if_too_fast(self, cluster):
+    def test_sequential_not_emitted_if_too_fast(self, cluster):
         """Presses within DUAL_BUTTON_TIMEOUT should emit dual button, not sequential."""
         # Press ON
-        await TestHelpers.press_button(cluster, ON_COMMAND_ID)
-        await asyncio.sleep(QUICK_PRESS_INTERVAL)
+        TestHelpers.press_button(cluster, ON_COMMAND_ID)
+        TestHelpers.advance(cluster, QUICK_PRESS_INTERVAL)
         
         # Press OFF within DUAL_BUTTON_TIMEOUT (too fast for sequential)
-        await TestHelpers.press_button(cluster, OFF_COMMAND_ID)
-        await TestHelpers.wait_for_event()
+        TestHelpers.press_button(cluster, OFF_COMMAND_ID)
+        TestHelpers.wait_for_event(cluster)
         
         # Should emit dual button event, not sequential
         TestHelpers.assert_event_emitted(cluster, "button_double")
@@ -557,230 +577,133 @@ class TestSequentialPresses:
 class TestTripleClickSequences:
     """Tests for triple-click button sequences (on_on_off, on_off_on, etc.)."""
     
-    @pytest.mark.asyncio
-    async def test_on_on_off_sequence(self, cluster):
-        """ON-ON-OFF sequence should emit on_on_off event."""
-        await TestHelpers.press_button(cluster, ON_COMMAND_ID)
-        await asyncio.sleep(TEST_DUAL_BUTTON_TIMEOUT + MINIMAL_PRESS_INTERVAL)
-        await TestHelpers.press_button(cluster, ON_COMMAND_ID)
-        await asyncio.sleep(TEST_DUAL_BUTTON_TIMEOUT + MINIMAL_PRESS_INTERVAL)
-        await TestHelpers.press_button(cluster, OFF_COMMAND_ID)
-        await TestHelpers.wait_for_event()
-        
-        TestHelpers.assert_event_emitted(cluster, "on_on_off")
-        TestHelpers.assert_event_count(cluster, 1)
-    
-    @pytest.mark.asyncio
-    async def test_on_off_on_sequence(self, cluster):
-        """ON-OFF-ON sequence should emit on_off_on event."""
-        await TestHelpers.press_button(cluster, ON_COMMAND_ID)
-        await asyncio.sleep(TEST_DUAL_BUTTON_TIMEOUT + MINIMAL_PRESS_INTERVAL)
-        await TestHelpers.press_button(cluster, OFF_COMMAND_ID)
-        await asyncio.sleep(TEST_DUAL_BUTTON_TIMEOUT + MINIMAL_PRESS_INTERVAL)
-        await TestHelpers.press_button(cluster, ON_COMMAND_ID)
-        await TestHelpers.wait_for_event()
-        
-        TestHelpers.assert_event_emitted(cluster, "on_off_on")
-        TestHelpers.assert_event_count(cluster, 1)
-    
-    @pytest.mark.asyncio
-    async def test_off_on_off_sequence(self, cluster):
-        """OFF-ON-OFF sequence should emit off_on_off event."""
-        await TestHelpers.press_button(cluster, OFF_COMMAND_ID)
-        await asyncio.sleep(TEST_DUAL_BUTTON_TIMEOUT + MINIMAL_PRESS_INTERVAL)
-        await TestHelpers.press_button(cluster, ON_COMMAND_ID)
-        await asyncio.sleep(TEST_DUAL_BUTTON_TIMEOUT + MINIMAL_PRESS_INTERVAL)
-        await TestHelpers.press_button(cluster, OFF_COMMAND_ID)
-        await TestHelpers.wait_for_event()
-        
-        TestHelpers.assert_event_emitted(cluster, "off_on_off")
-        TestHelpers.assert_event_count(cluster, 1)
-    
-    @pytest.mark.asyncio
-    async def test_off_off_on_sequence(self, cluster):
-        """OFF-OFF-ON sequence should emit off_off_on event."""
-        await TestHelpers.press_button(cluster, OFF_COMMAND_ID)
-        await asyncio.sleep(TEST_DUAL_BUTTON_TIMEOUT + MINIMAL_PRESS_INTERVAL)
-        await TestHelpers.press_button(cluster, OFF_COMMAND_ID)
-        await asyncio.sleep(TEST_DUAL_BUTTON_TIMEOUT + MINIMAL_PRESS_INTERVAL)
-        await TestHelpers.press_button(cluster, ON_COMMAND_ID)
-        await TestHelpers.wait_for_event()
-        
-        TestHelpers.assert_event_emitted(cluster, "off_off_on")
-        TestHelpers.assert_event_count(cluster, 1)
-    
-    @pytest.mark.asyncio
-    async def test_on_on_on_sequence(self, cluster):
-        """ON-ON-ON triple press should emit triple press event."""
-        await TestHelpers.press_button(cluster, ON_COMMAND_ID)
-        await asyncio.sleep(TEST_DUAL_BUTTON_TIMEOUT + MINIMAL_PRESS_INTERVAL)
-        await TestHelpers.press_button(cluster, ON_COMMAND_ID)
-        await asyncio.sleep(TEST_DUAL_BUTTON_TIMEOUT + MINIMAL_PRESS_INTERVAL)
-        await TestHelpers.press_button(cluster, ON_COMMAND_ID)
-        await TestHelpers.wait_for_event()
-        
-        TestHelpers.assert_event_emitted(cluster, "on_remote_button_triple_press")
+    @pytest.mark.parametrize("sequence,expected_event", [
+        ((ON_COMMAND_ID, ON_COMMAND_ID, OFF_COMMAND_ID), "on_on_off"),
+        ((ON_COMMAND_ID, OFF_COMMAND_ID, ON_COMMAND_ID), "on_off_on"),
+        ((OFF_COMMAND_ID, ON_COMMAND_ID, OFF_COMMAND_ID), "off_on_off"),
+        ((OFF_COMMAND_ID, OFF_COMMAND_ID, ON_COMMAND_ID), "off_off_on"),
+        ((ON_COMMAND_ID, ON_COMMAND_ID, ON_COMMAND_ID), "on_remote_button_triple_press"),
+        ((OFF_COMMAND_ID, OFF_COMMAND_ID, OFF_COMMAND_ID), "off_remote_button_triple_press"),
+        ((ON_COMMAND_ID, OFF_COMMAND_ID, OFF_COMMAND_ID), "on_off_off"),
+        ((OFF_COMMAND_ID, ON_COMMAND_ID, ON_COMMAND_ID), "off_on_on"),
+    ])
+    def test_triple_sequence(self, cluster, sequence, expected_event):
+        """Three sequential presses should emit the sequence (or triple press) event."""
+        TestHelpers.press_sequence(
+            cluster, sequence, interval=TEST_DUAL_BUTTON_TIMEOUT + MINIMAL_PRESS_INTERVAL
+        )
+        TestHelpers.wait_for_event(cluster)
+        
+        TestHelpers.assert_event_emitted(cluster, expected_event)
         TestHelpers.assert_event_count(cluster, 1)
+
+
+class TestDeviceAutomationTriggers:
+    """Tests to verify device_automation_triggers are properly defined."""
     
-    @pytest.mark.asyncio
-    async def test_off_off_off_sequence(self, cluster):
-        """OFF-OFF-OFF triple press should emit triple press event."""
-        await TestHelpers.press_button(cluster, OFF_COMMAND_ID)
-        await asyncio.sleep(TEST_DUAL_BUTTON_TIMEOUT + MINIMAL_PRESS_INTERVAL)
-        await TestHelpers.press_button(cluster, OFF_COMMAND_ID)
-        await asyncio.sleep(TEST_DUAL_BUTTON_TIMEOUT + MINIMAL_PRESS_INTERVAL)
-        await TestHelpers.press_button(cluster, OFF_COMMAND_ID)
-        await TestHelpers.wait_for_event()
-        
-        TestHelpers.assert_event_emitted(cluster, "off_remote_button_triple_press")
-        TestHelpers.assert_event_count(cluster, 1)
+    def test_required_keys_present(self, rodret_triggers):
+        """All expected triggers should be defined."""
+        missing = EXPECTED_KEYS - rodret_triggers.keys()
+        assert not missing, f"Missing triggers: {missing}"
     
-    @pytest.mark.asyncio
-    async def test_on_off_off_sequence(self, cluster):
-        """ON-OFF-OFF sequence should emit on_off_off event."""
-        await TestHelpers.press_button(cluster, ON_COMMAND_ID)
-        await asyncio.sleep(TEST_DUAL_BUTTON_TIMEOUT + MINIMAL_PRESS_INTERVAL)
-        await TestHelpers.press_button(cluster, OFF_COMMAND_ID)
-        await asyncio.sleep(TEST_DUAL_BUTTON_TIMEOUT + MINIMAL_PRESS_INTERVAL)
-        await TestHelpers.press_button(cluster, OFF_COMMAND_ID)
-        await TestHelpers.wait_for_event()
-        
-        TestHelpers.assert_event_emitted(cluster, "on_off_off")
-        TestHelpers.assert_event_count(cluster, 1)
+    @pytest.mark.parametrize("click_type,command,expected_event", [
+        pytest.param(*case, id=f"{case[1]}-{case[0]}") for case in TRIGGER_CASES
+    ])
+    def test_trigger_defined(self, rodret_triggers, click_type, command, expected_event):
+        """Each expected trigger should map to the emitted event name."""
+        assert rodret_triggers[(click_type, command)][COMMAND] == expected_event
     
-    @pytest.mark.asyncio
-    async def test_off_on_on_sequence(self, cluster):
-        """OFF-ON-ON sequence should emit off_on_on event."""
-        await TestHelpers.press_button(cluster, OFF_COMMAND_ID)
-        await asyncio.sleep(TEST_DUAL_BUTTON_TIMEOUT + MINIMAL_PRESS_INTERVAL)
-        await TestHelpers.press_button(cluster, ON_COMMAND_ID)
-        await asyncio.sleep(TEST_DUAL_BUTTON_TIMEOUT + MINIMAL_PRESS_INTERVAL)
-        await TestHelpers.press_button(cluster, ON_COMMAND_ID)
-        await TestHelpers.wait_for_event()
-        
-        TestHelpers.assert_event_emitted(cluster, "off_on_on")
-        TestHelpers.assert_event_count(cluster, 1)
+    def test_total_trigger_count(self, rodret_triggers):
+        """Verify the total number of triggers is correct."""
+        assert len(rodret_triggers) == EXPECTED_TOTAL_TRIGGERS, \
+            f"Expected {EXPECTED_TOTAL_TRIGGERS} triggers, got {len(rodret_triggers)}"
 
 
-class TestDeviceAutomationTriggers:
-    """Tests to verify device_automation_triggers are properly defined."""
+class TestNegativeCases:
+    """Tests to verify correct behavior and prevent regressions."""
     
-    def test_all_single_button_triggers_defined(self):
-        """Verify all single button click triggers are defined."""
-        from ikea_rodret import IkeaRodretRemoteMultiClick
-        
-        triggers = IkeaRodretRemoteMultiClick.device_automation_triggers
-        
-        # ON button triggers
-        assert (SHORT_PRESS, COMMAND_ON) in triggers
-        assert (DOUBLE_PRESS, COMMAND_ON) in triggers
-        assert (TRIPLE_PRESS, COMMAND_ON) in triggers
-        assert (QUADRUPLE_PRESS, COMMAND_ON) in triggers
-        assert (QUINTUPLE_PRESS, COMMAND_ON) in triggers
+    def test_single_press_emits_one_exact_event(self, cluster):
+        """Single press should emit exactly one event, with an exact name."""
+        TestHelpers.press_button(cluster, ON_COMMAND_ID)
+        TestHelpers.wait_for_event(cluster)
         
-        # OFF button triggers
-        assert (SHORT_PRESS, COMMAND_OFF) in triggers
-        assert (DOUBLE_PRESS, COMMAND_OFF) in triggers
-        assert (TRIPLE_PRESS, COMMAND_OFF) in triggers
-        assert (QUADRUPLE_PRESS, COMMAND_OFF) in triggers
-        assert (QUINTUPLE_PRESS, COMMAND_OFF) in triggers
+        # Should be exactly 1 event, not 2 or more
+        TestHelpers.assert_event_count(cluster, 1)
+        # Should be exactly this, not a substring
+        TestHelpers.assert_event_emitted(cluster, "on_remote_button_short_press")
     
-    def test_all_dual_button_triggers_defined(self):
-        """Verify all dual button click triggers are defined."""
-        from ikea_rodret import IkeaRodretRemoteMultiClick
-        
-        triggers = IkeaRodretRemoteMultiClick.device_automation_triggers
+    def test_mixed_burst_emits_single_event(self, cluster):
+        """A burst of mixed presses within CLICK_TIMEOUT should emit exactly one event."""
+        TestHelpers.press_sequence(
+            cluster, [ON_COMMAND_ID, OFF_COMMAND_ID, ON_COMMAND_ID, ON_COMMAND_ID, OFF_COMMAND_ID]
+        )
+        TestHelpers.wait_for_event(cluster)
         
-        assert (SHORT_PRESS, COMMAND_BUTTON_DOUBLE) in triggers
-        assert (DOUBLE_PRESS, COMMAND_BUTTON_DOUBLE) in triggers
-        assert (TRIPLE_PRESS, COMMAND_BUTTON_DOUBLE) in triggers
+        TestHelpers.assert_event_count(cluster, 1)
+        assert cluster._timer is None
     
-    def test_all_sequential_triggers_defined(self):
-        """Verify all sequential button press triggers are defined."""
-        from ikea_rodret import IkeaRodretRemoteMultiClick
-        
-        triggers = IkeaRodretRemoteMultiClick.device_automation_triggers
-        
-        # Two-button sequences
-        assert (SHORT_PRESS, "on_off") in triggers
-        assert (SHORT_PRESS, "off_on") in triggers
+    def test_long_same_button_run_then_other_button(self, cluster):
+        """A press after ten identical ones should still make the burst a sequence."""
+        TestHelpers.press_sequence(
+            cluster, [ON_COMMAND_ID] * 10 + [OFF_COMMAND_ID],
+            interval=TEST_DUAL_BUTTON_TIMEOUT + QUICK_PRESS_INTERVAL,
+        )
+        TestHelpers.wait_for_event(cluster)
         
-        # Three-button sequences (6 combinations - excluding same button)
-        assert (SHORT_PRESS, "on_on_off") in triggers
-        assert (SHORT_PRESS, "on_off_on") in triggers
-        assert (SHORT_PRESS, "on_off_off") in triggers
-        assert (SHORT_PRESS, "off_on_on") in triggers
-        assert (SHORT_PRESS, "off_on_off") in triggers
-        assert (SHORT_PRESS, "off_off_on") in triggers
+        TestHelpers.assert_event_emitted(cluster, "_".join(["on"] * 10 + ["off"]))
+        TestHelpers.assert_event_count(cluster, 1)
     
-    def test_trigger_command_values_correct(self):
-        """Verify trigger command values are correctly formatted."""
-        from ikea_rodret import IkeaRodretRemoteMultiClick
-        
-        triggers = IkeaRodretRemoteMultiClick.device_automation_triggers
+    def test_odd_alternating_burst_is_not_dual(self, cluster):
+        """Eleven rapid alternating presses leave a pair open and emit a sequence."""
+        TestHelpers.press_sequence(cluster, [ON_COMMAND_ID, OFF_COMMAND_ID] * 5 + [ON_COMMAND_ID])
+        TestHelpers.wait_for_event(cluster)
         
-        # Check single button triggers
-        assert triggers[(SHORT_PRESS, COMMAND_ON)][COMMAND] == f"{COMMAND_ON}_{SHORT_PRESS}"
-        assert triggers[(DOUBLE_PRESS, COMMAND_ON)][COMMAND] == f"{COMMAND_ON}_{DOUBLE_PRESS}"
-        assert triggers[(SHORT_PRESS, COMMAND_OFF)][COMMAND] == f"{COMMAND_OFF}_{SHORT_PRESS}"
-        assert triggers[(DOUBLE_PRESS, COMMAND_OFF)][COMMAND] == f"{COMMAND_OFF}_{DOUBLE_PRESS}"
-        
-        # Check dual button triggers
-        assert triggers[(SHORT_PRESS, COMMAND_BUTTON_DOUBLE)][COMMAND] == COMMAND_BUTTON_DOUBLE
-        assert triggers[(DOUBLE_PRESS, COMMAND_BUTTON_DOUBLE)][COMMAND] == f"{COMMAND_BUTTON_DOUBLE}_{DOUBLE_PRESS}"
-        
-        # Check sequential triggers
-        assert triggers[(SHORT_PRESS, "on_off")][COMMAND] == "on_off"
-        assert triggers[(SHORT_PRESS, "off_on")][COMMAND] == "off_on"
+        TestHelpers.assert_event_emitted(cluster, "_".join(["on", "off"] * 5 + ["on"]))
+        TestHelpers.assert_event_count(cluster, 1)
     
-    def test_total_trigger_count(self):
-        """Verify the total number of triggers is correct."""
-        from ikea_rodret import IkeaRodretRemoteMultiClick
+    def test_six_dual_presses_capped_at_quintuple(self, cluster):
+        """Six rapid dual button presses should emit the dual quintuple press."""
+        TestHelpers.press_sequence(cluster, [ON_COMMAND_ID, OFF_COMMAND_ID] * 6)
+        TestHelpers.wait_for_event(cluster)
         
-        triggers = IkeaRodretRemoteMultiClick.device_automation_triggers
+        TestHelpers.assert_event_emitted(cluster, f"{COMMAND_BUTTON_DOUBLE}_{QUINTUPLE_PRESS}")
+        TestHelpers.assert_event_count(cluster, 1)
+    
+    def test_dual_button_resets_individual_counts(self, cluster):
+        """Dual button detection should emit correct event."""
+        # Pressing OFF within DUAL_BUTTON_TIMEOUT triggers dual button detection
+        TestHelpers.press_sequence(cluster, [ON_COMMAND_ID, OFF_COMMAND_ID])
+        TestHelpers.wait_for_event(cluster)
         
-        # 5 single button clicks × 2 buttons = 10
-        # 3 dual button clicks = 3
-        # 2 two-button sequences = 2
-        # 6 three-button sequences (excluding same button) = 6
-        # Total = 21
-        assert len(triggers) == 21, f"Expected 21 triggers, got {len(triggers)}"
+        # Should emit dual button event
+        TestHelpers.assert_event_emitted(cluster, "button_double")
+        TestHelpers.assert_event_count(cluster, 1)
 
 
-class TestNegativeCases:
-    """Tests to verify correct behavior and prevent regressions."""
+class TestRealEventLoop:
+    """Smoke test of the production scheduling path (running loop, real timers).
     
-    @pytest.mark.asyncio
-    async def test_no_duplicate_events(self, cluster):
-        """Single press should emit exactly one event, not duplicates."""
-        await TestHelpers.press_button(cluster, ON_COMMAND_ID)
-        await TestHelpers.wait_for_event()
-        
-        # Should be exactly 1 event, not 2 or more
-        TestHelpers.assert_event_count(cluster, 1)
+    All other tests drive the cluster from a FakeLoop; this one lets it pick
+    up the running event loop and schedule real TimerHandles.
+    """
     
     @pytest.mark.asyncio
-    async def test_event_name_exact_match(self, cluster):
-        """Event names should match exactly, not just contain substring."""
-        await TestHelpers.press_button(cluster, ON_COMMAND_ID)
-        await TestHelpers.wait_for_event()
+    async def test_double_press_on_running_loop(self, cluster):
+        """Two ON presses on a real loop should emit a double press event."""
+        # Drop the fake clock so the cluster resolves the running loop
+        cluster._loop = None
+        
+        TestHelpers.press_button(cluster, ON_COMMAND_ID)
+        first_timer = cluster._timer
+        assert isinstance(first_timer, asyncio.TimerHandle)
+        assert cluster._loop is asyncio.get_running_loop()
         
-        event_name = TestHelpers.get_event_name(cluster, 0)
-        # Should be exactly this, not a substring
-        assert "on_remote_button_short_press" in event_name
-        assert "double" not in event_name
-        assert "triple" not in event_name
-    
-    @pytest.mark.asyncio
-    async def test_dual_button_resets_individual_counts(self, cluster):
-        """Dual button detection should emit correct event."""
-        await TestHelpers.press_button(cluster, ON_COMMAND_ID)
         await asyncio.sleep(QUICK_PRESS_INTERVAL)
+        TestHelpers.press_button(cluster, ON_COMMAND_ID)
+        assert first_timer.cancelled(), "Second press should cancel the pending timer"
         
-        # Pressing OFF within DUAL_BUTTON_TIMEOUT triggers dual button detection
-        await TestHelpers.press_button(cluster, OFF_COMMAND_ID)
-        await TestHelpers.wait_for_event()
+        await asyncio.sleep(WAIT_FOR_EVENT)
         
-        # Should emit dual button event
-        TestHelpers.assert_event_emitted(cluster, "button_double")
+        TestHelpers.assert_event_emitted(cluster, "on_remote_button_double_press")
         TestHelpers.assert_event_count(cluster, 1)
+        assert cluster._timer is None
@@ -0,0 +1,219 @@
+"""Unit tests for the Sonoff TRVZB virtual valve position handling.
+
+The virtual position (0-100%) is mapped onto the calibrated range between
+valve_min_limit and valve_max_limit before being written to the device, and
+device reports are mapped back.
+
+Test Coverage:
+- Endpoints: 0% and 100% pass through unchanged
+- Scaling: positions inside the calibrated range, including rounding
+- Clamping: results stay within the limits (or 0-100 when mapping back)
+- Degenerate ranges: min == max
+- Writes: payload forwarded to the device and result for real, virtual and mixed writes
+- Reports: valve opening reports update the virtual position with one notification
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+sonoff_trvzb = pytest.importorskip("sonoff_trvzb", exc_type=ImportError)
+CustomSonoffCluster = sonoff_trvzb.CustomSonoffCluster
+foundation = sonoff_trvzb.foundation
+
+# Result returned by the patched parent write, to check it is passed through
+DEVICE_WRITE_RESULT = [[foundation.WriteAttributesStatusRecord(foundation.Status.SUCCESS)]]
+
+
+def calibrated_cluster(min_limit, max_limit):
+    """Create a cluster with the given calibration limits, without a device."""
+    cluster = CustomSonoffCluster.__new__(CustomSonoffCluster)
+    cluster._valve_min_limit = min_limit
+    cluster._valve_max_limit = max_limit
+    cluster._recompute_span()
+    return cluster
+
+
+@pytest.fixture
+def cluster():
+    """Create a cluster through its real constructor, on a minimal endpoint."""
+    endpoint = SimpleNamespace(device=SimpleNamespace(ieee="00:11:22:33:44:55:66:77"))
+    return CustomSonoffCluster(endpoint)
+
+
+@pytest.fixture
+def device_writes(monkeypatch):
+    """Record the attributes forwarded to the parent write instead of sending them."""
+    writes = []
+
+    async def write_attributes(self, attributes, manufacturer=None):
+        writes.append(attributes)
+        return DEVICE_WRITE_RESULT
+
+    monkeypatch.setattr(sonoff_trvzb.CustomCluster, "write_attributes", write_attributes)
+    return writes
+
+
+class AttributeListener:
+    """Record the attribute_updated notifications of a cluster."""
+
+    def __init__(self):
+        self.updates = []
+
+    def attribute_updated(self, attrid, value, timestamp):
+        self.updates.append((attrid, value))
+
+
+class TestVirtualToReal:
+    """Tests for virtual position → real position conversion."""
+
+    @pytest.mark.parametrize("virtual_pos", [0, 100])
+    def test_endpoints_pass_through(self, virtual_pos):
+        """Fully closed and fully open bypass the calibrated range."""
+        cluster = calibrated_cluster(20, 80)
+        assert cluster._virtual_to_real(virtual_pos) == virtual_pos
+
+    @pytest.mark.parametrize("virtual_pos,expected", [
+        (1, 20),
+        (50, 50),
+        (33, 39),
+        (99, 79),
+    ])
+    def test_scales_into_calibrated_range(self, virtual_pos, expected):
+        """Intermediate positions are scaled between the limits and truncated."""
+        cluster = calibrated_cluster(20, 80)
+        assert cluster._virtual_to_real(virtual_pos) == expected
+
+    @pytest.mark.parametrize("virtual_pos", [29, 57, 58])
+    def test_exact_rounding_on_full_range(self, virtual_pos):
+        """With limits 0-100 the mapping is the identity (float math gave n - 1 here)."""
+        cluster = calibrated_cluster(0, 100)
+        assert cluster._virtual_to_real(virtual_pos) == virtual_pos
+
+    def test_clamps_to_max_limit(self):
+        """Out of range input is clamped to the max limit."""
+        cluster = calibrated_cluster(20, 80)
+        assert cluster._virtual_to_real(150) == 80
+
+    def test_clamps_to_min_limit(self):
+        """Negative input is clamped to the min limit."""
+        cluster = calibrated_cluster(20, 80)
+        assert cluster._virtual_to_real(-10) == 20
+
+    def test_inverted_limits_resolve_to_min(self):
+        """A misconfigured min > max resolves to the min limit."""
+        cluster = calibrated_cluster(80, 20)
+        assert cluster._virtual_to_real(50) == 80
+
+    def test_empty_range_returns_min(self):
+        """With min == max every position maps to that limit."""
+        cluster = calibrated_cluster(40, 40)
+        assert cluster._virtual_to_real(50) == 40
+
+
+class TestRealToVirtual:
+    """Tests for real position → virtual position conversion."""
+
+    @pytest.mark.parametrize("real_pos,expected", [
+        (20, 0),
+        (50, 50),
+        (80, 100),
+        (47, 45),
+    ])
+    def test_scales_from_calibrated_range(self, real_pos, expected):
+        """Real positions between the limits map onto 0-100, truncated."""
+        cluster = calibrated_cluster(20, 80)
+        assert cluster._real_to_virtual(real_pos) == expected
+
+    @pytest.mark.parametrize("real_pos,expected", [
+        (0, 0),
+        (10, 0),
+        (95, 100),
+        (100, 100),
+    ])
+    def test_clamps_outside_limits(self, real_pos, expected):
+        """Real positions outside the limits are clamped to 0-100."""
+        cluster = calibrated_cluster(20, 80)
+        assert cluster._real_to_virtual(real_pos) == expected
+
+    def test_empty_range_returns_zero(self):
+        """With min == max every real position maps to 0."""
+        cluster = calibrated_cluster(40, 40)
+        assert cluster._real_to_virtual(60) == 0
+
+    @pytest.mark.parametrize("virtual_pos", range(0, 101))
+    def test_round_trip_on_full_range(self, virtual_pos):
+        """With limits 0-100 both conversions are the identity."""
+        cluster = calibrated_cluster(0, 100)
+        assert cluster._real_to_virtual(cluster._virtual_to_real(virtual_pos)) == virtual_pos
+
+
+class TestValveReports:
+    """Tests for valve opening degree (0x600B) reports."""
+
+    def test_report_updates_virtual_position_once(self, cluster):
+        """A report moving the virtual position caches it and notifies only 0x7002."""
+        cluster._update_attribute(0x7000, 20)
+        cluster._update_attribute(0x7001, 80)
+        listener = AttributeListener()
+        cluster.add_listener(listener)
+
+        cluster._update_attribute(0x600B, 47)
+
+        assert cluster._attr_cache[0x600B] == 47
+        assert cluster._attr_cache[0x7002] == 45
+        assert listener.updates == [(0x7002, 45)]
+
+    def test_report_without_position_change_notifies_opening(self, cluster):
+        """A report that leaves the virtual position unchanged notifies 0x600B."""
+        listener = AttributeListener()
+        cluster.add_listener(listener)
+
+        cluster._update_attribute(0x600B, 0)
+
+        assert cluster._attr_cache[0x7002] == 0
+        assert listener.updates == [(0x600B, 0)]
+
+
+class TestWriteAttributes:
+    """Tests for the attributes forwarded by write_attributes."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("attr_key", [0x0000, "child_lock"])
+    async def test_single_real_write_forwarded_unchanged(self, cluster, device_writes, attr_key):
+        """A single real attribute is forwarded as given, by id or by name."""
+        result = await cluster.write_attributes({attr_key: True})
+        assert device_writes == [{attr_key: True}]
+        assert result is DEVICE_WRITE_RESULT
+
+    @pytest.mark.asyncio
+    async def test_virtual_position_writes_opening_and_closing(self, cluster, device_writes):
+        """The virtual position is written as the calibrated opening and closing degrees."""
+        cluster._update_attribute(0x7000, 20)
+        cluster._update_attribute(0x7001, 80)
+        result = await cluster.write_attributes({0x7002: 33})
+        assert device_writes == [{0x600B: 39, 0x600C: 61}]
+        assert result is DEVICE_WRITE_RESULT
+        assert cluster._attr_cache[0x7002] == 33
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("attr_key,attr_id", [
+        (0x7000, 0x7000),
+        (0x7001, 0x7001),
+        ("valve_min_limit", 0x7000),
+        ("valve_max_limit", 0x7001),
+    ])
+    async def test_limit_write_stays_local(self, cluster, device_writes, attr_key, attr_id):
+        """Calibration limits are stored without any device write."""
+        result = await cluster.write_attributes({attr_key: 30})
+        assert device_writes == []
+        assert result == [[foundation.WriteAttributesStatusRecord(foundation.Status.SUCCESS)]]
+        assert cluster._attr_cache[attr_id] == 30
+
+    @pytest.mark.asyncio
+    async def test_mixed_write_sent_in_one_frame(self, cluster, device_writes):
+        """Real and virtual attributes are forwarded together, named ones by id."""
+        result = await cluster.write_attributes({"child_lock": True, 0x7002: 50, 0x7000: 20})
+        assert device_writes == [{0x0000: True, 0x600B: 50, 0x600C: 50}]
+        assert result is DEVICE_WRITE_RESULT
+        assert cluster._valve_min_limit == 20